@@ -4,9 +4,10 @@
 import typing
 
 from os import getenv, environ
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from diem import diem_types, testnet, utils, LocalAccount, identifier
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from nacl.signing import SigningKey
 
 
 @dataclass
@@ -19,6 +20,9 @@ class Config:
     base_url: str
     chain_id: int
     gas_currency_code: str
+    _compliance_signing_key: typing.Optional[SigningKey] = field(
+        init=False, default=None, repr=False
+    )
 
     def vasp_account_address(self) -> diem_types.AccountAddress:
         return utils.account_address(self.vasp_address)
@@ -27,10 +31,21 @@ class Config:
         return identifier.HRPS.get(self.chain_id, identifier.PDM)
 
     def compliance_private_key(self) -> Ed25519PrivateKey:
+        # kept for key export and the jws signing callbacks; recipient
+        # signatures use the cached compliance_signing_key below
         return Ed25519PrivateKey.from_private_bytes(
             bytes.fromhex(self.vasp_compliance_key)
         )
 
+    def compliance_signing_key(self) -> SigningKey:
+        # libsodium-backed key, built once from the raw seed and reused
+        # for every travel rule signature
+        if self._compliance_signing_key is None:
+            self._compliance_signing_key = SigningKey(
+                bytes.fromhex(self.vasp_compliance_key)
+            )
+        return self._compliance_signing_key
+
     def compliance_public_key_bytes(self) -> bytes:
         return utils.public_key_bytes(self.compliance_private_key().public_key())
 
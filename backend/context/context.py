@@ -5,6 +5,9 @@ import logging
 import time
 from dataclasses import dataclass, field
 
+import requests
+from requests.adapters import HTTPAdapter
+
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PrivateKey,
     Ed25519PublicKey,
@@ -32,10 +35,18 @@ class Context:
     offchain_client: offchain.Client = field(init=False)
 
     def __post_init__(self) -> None:
+        # one keep-alive session shared by every outbound counterparty
+        # call, so command exchanges reuse pooled TLS connections
+        # instead of paying a handshake per request
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=128)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         self.offchain_client = offchain.Client(
             self.config.vasp_account_address(),
             self.jsonrpc_client,
             self.config.diem_address_hrp(),
+            session=session,
         )
 
     # ---- delegate to jsonrpc client start ----
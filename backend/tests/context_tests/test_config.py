@@ -41,6 +41,17 @@ def test_generate_config():
     assert conf.gas_currency_code == "XUS"
 
 
+def test_compliance_signing_key_matches_private_key():
+    _, conf = config.generate(1)
+    msg = b"travel rule signature message"
+
+    signature = conf.compliance_signing_key().sign(msg).signature
+
+    assert signature == conf.compliance_private_key().sign(msg)
+    # built once and reused afterwards
+    assert conf.compliance_signing_key() is conf.compliance_signing_key()
+
+
 def test_vasp_account_address():
     conf = config.from_env()
     assert conf.vasp_account_address()
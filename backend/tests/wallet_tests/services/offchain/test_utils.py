@@ -0,0 +1,49 @@
+# Copyright (c) The Diem Core Contributors
+# SPDX-License-Identifier: Apache-2.0
+from nacl.signing import SigningKey
+
+from wallet.services.offchain import utils
+
+
+def _signed_batch(count):
+    keys = [SigningKey.generate() for _ in range(count)]
+    messages = [f"message {index}".encode() for index in range(count)]
+    signatures = [key.sign(msg).signature for key, msg in zip(keys, messages)]
+    public_keys = [bytes(key.verify_key) for key in keys]
+    return messages, signatures, public_keys
+
+
+def test_verify_signatures_batch_all_valid():
+    messages, signatures, public_keys = _signed_batch(3)
+
+    assert utils.verify_signatures_batch(messages, signatures, public_keys) == []
+
+
+def test_verify_signatures_batch_reports_bad_signature():
+    messages, signatures, public_keys = _signed_batch(3)
+    signatures[1] = bytes(64)
+
+    assert utils.verify_signatures_batch(messages, signatures, public_keys) == [1]
+
+
+def test_verify_signatures_batch_reports_malformed_signature():
+    messages, signatures, public_keys = _signed_batch(3)
+    # wrong length; must be flagged, not raised
+    signatures[0] = b"\x00\x01\x02"
+
+    failed = utils.verify_signatures_batch(messages, signatures, public_keys)
+
+    assert failed == [0]
+
+
+def test_verify_signatures_batch_reuses_keys_across_entries():
+    key = SigningKey.generate()
+    messages = [b"first", b"second"]
+    signatures = [key.sign(msg).signature for msg in messages]
+    public_keys = [bytes(key.verify_key)] * 2
+
+    assert utils.verify_signatures_batch(messages, signatures, public_keys) == []
+    # swapped signatures fail independently
+    assert utils.verify_signatures_batch(
+        messages, list(reversed(signatures)), public_keys
+    ) == [0, 1]
@@ -17,6 +17,7 @@ from webapp import app
 
 
 app.secret_key = "testing"
+app.testing = True
 
 
 @pytest.fixture(autouse=True)
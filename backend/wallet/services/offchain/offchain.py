@@ -173,7 +173,9 @@ def process_offchain_tasks() -> None:
             sig_msg = model.recipient_signature
 
         new_command = payment_command.new_command(
-            recipient_signature=utils.compliance_private_key().sign(sig_msg).hex(),
+            recipient_signature=utils.compliance_signing_key()
+            .sign(sig_msg)
+            .signature.hex(),
             kyc_data=kyc_data,
             status=offchain.Status.ready_for_settlement,
             inbound=payment_command.inbound,
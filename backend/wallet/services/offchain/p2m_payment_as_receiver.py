@@ -94,7 +94,7 @@ def sign_as_receiver(reference_id, sender_address, amount):
 
     sig_msg = txnmetadata.travel_rule(reference_id, sender_address, amount)[1]
 
-    return utils.compliance_private_key().sign(sig_msg).hex()
+    return utils.compliance_signing_key().sign(sig_msg).signature.hex()
 
 
 def handle_init_authorize_command(request: CommandRequestObject):
@@ -3,6 +3,8 @@ import context
 import typing
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from diem import identifier, diem_types, jsonrpc
+from nacl.exceptions import BadSignatureError
+from nacl.signing import SigningKey, VerifyKey
 from offchain.types import (
     GetInfoCommandResponse,
     InitChargePaymentResponse,
@@ -16,12 +18,56 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# constants for the life of the process, primed once at app startup so
+# the hot offchain path never walks the context object per call
+_HRP: Optional[str] = None
+_VASP_ADDRESS: Optional[str] = None
+_COMPLIANCE_KEY: Optional[Ed25519PrivateKey] = None
+_SIGNING_KEY: Optional[SigningKey] = None
+_COMPLIANCE_PUBLIC_KEY_BYTES: Optional[bytes] = None
+
+
+def _prime() -> None:
+    global _HRP, _VASP_ADDRESS, _COMPLIANCE_KEY, _SIGNING_KEY
+    global _COMPLIANCE_PUBLIC_KEY_BYTES
+    config = context.get().config
+    _HRP = config.diem_address_hrp()
+    _VASP_ADDRESS = config.vasp_address
+    _COMPLIANCE_KEY = config.compliance_private_key()
+    _SIGNING_KEY = config.compliance_signing_key()
+    _COMPLIANCE_PUBLIC_KEY_BYTES = config.compliance_public_key_bytes()
+
+
 def hrp() -> str:
-    return context.get().config.diem_address_hrp()
+    value = _HRP
+    if value is None:
+        _prime()
+        value = typing.cast(str, _HRP)
+    return value
 
 
 def compliance_private_key() -> Ed25519PrivateKey:
-    return context.get().config.compliance_private_key()
+    value = _COMPLIANCE_KEY
+    if value is None:
+        _prime()
+        value = typing.cast(Ed25519PrivateKey, _COMPLIANCE_KEY)
+    return value
+
+
+def compliance_signing_key() -> SigningKey:
+    value = _SIGNING_KEY
+    if value is None:
+        _prime()
+        value = typing.cast(SigningKey, _SIGNING_KEY)
+    return value
+
+
+def compliance_public_key_bytes() -> bytes:
+    value = _COMPLIANCE_PUBLIC_KEY_BYTES
+    if value is None:
+        _prime()
+        value = typing.cast(bytes, _COMPLIANCE_PUBLIC_KEY_BYTES)
+    return value
 
 
 def offchain_client() -> offchain.Client:
@@ -29,9 +75,7 @@ def offchain_client() -> offchain.Client:
 
 
 def account_address_and_subaddress(address: str) -> Tuple[str, Optional[str]]:
-    account_address, sub = identifier.decode_account(
-        address, context.get().config.diem_address_hrp()
-    )
+    account_address, sub = identifier.decode_account(address, hrp())
     return account_address.to_hex(), sub.hex() if sub else None
 
 
@@ -42,7 +86,10 @@ def user_kyc_data(user_id: int) -> offchain.KycDataObject:
 
 
 def generate_my_address(account_id):
-    vasp_address = context.get().config.vasp_address
+    vasp_address = _VASP_ADDRESS
+    if vasp_address is None:
+        _prime()
+        vasp_address = typing.cast(str, _VASP_ADDRESS)
     sub_address = account.generate_new_subaddress(account_id)
     return identifier.encode_account(vasp_address, sub_address, hrp())
 
@@ -62,12 +109,74 @@ def _send_kyc_data_and_recipient_signature(
     user_id = get_account_id_from_subaddr(command.receiver_subaddress(hrp()).hex())
 
     return command.new_command(
-        recipient_signature=compliance_private_key().sign(sig_msg).hex(),
+        recipient_signature=compliance_signing_key().sign(sig_msg).signature.hex(),
         kyc_data=user_kyc_data(user_id),
         status=offchain.Status.ready_for_settlement,
     )
 
 
+def verify_signatures_batch(
+    messages: typing.Sequence[bytes],
+    signatures: typing.Sequence[bytes],
+    public_keys: typing.Sequence[bytes],
+) -> typing.List[int]:
+    """Verify a batch of detached Ed25519 signatures in one pass.
+
+    Returns the indices of the entries that fail, so one bad or
+    malformed signature cannot poison the rest of the batch. libsodium
+    exposes no batch-open entry point through pynacl, so the batch cost
+    is amortized by reusing one VerifyKey per distinct public key
+    instead of rebuilding key state for every signature.
+    """
+    verify_keys: typing.Dict[bytes, VerifyKey] = {}
+    failed = []
+    for index, (message, signature, public_key) in enumerate(
+        zip(messages, signatures, public_keys)
+    ):
+        verify_key = verify_keys.get(public_key)
+        if verify_key is None:
+            verify_key = verify_keys[public_key] = VerifyKey(public_key)
+        try:
+            verify_key.verify(message, signature)
+        except (BadSignatureError, ValueError):
+            # ValueError covers wrong-length signatures
+            failed.append(index)
+    return failed
+
+
+def verify_recipient_signatures_batch(
+    commands: typing.Sequence[offchain.PaymentCommand],
+) -> typing.List[str]:
+    """Batch-verify the recipient signatures this wallet produced for a
+    page of payment commands, for the inbound / reconciliation flow.
+
+    Returns the reference ids of the commands whose signature is
+    malformed hex or fails verification."""
+    messages = []
+    signatures = []
+    public_keys = []
+    reference_ids = []
+    failed = []
+    public_key = compliance_public_key_bytes()
+    for command in commands:
+        if not (command.is_receiver() and command.payment.recipient_signature):
+            continue
+        try:
+            signature = bytes.fromhex(command.payment.recipient_signature)
+        except ValueError:
+            failed.append(command.reference_id())
+            continue
+        messages.append(command.travel_rule_metadata_signature_message(hrp()))
+        signatures.append(signature)
+        public_keys.append(public_key)
+        reference_ids.append(command.reference_id())
+    failed.extend(
+        reference_ids[index]
+        for index in verify_signatures_batch(messages, signatures, public_keys)
+    )
+    return failed
+
+
 def jws_response(
     cid: Optional[str],
     result_object: typing.Optional[
@@ -5,6 +5,7 @@ from offchain import FundPullPreApprovalStatus
 from wallet.services.offchain import fund_pull_pre_approval as fppa_service
 from webapp.routes.strict_schema_view import (
     StrictSchemaView,
+    json_response,
     query_str_param,
     response_definition,
     body_parameter,
@@ -60,7 +61,7 @@ class FundsPullPreApprovalsRoutes:
             ]
 
             return (
-                {"funds_pull_pre_approvals": serialized_preapprovals},
+                json_response({"funds_pull_pre_approvals": serialized_preapprovals}),
                 HTTPStatus.OK,
             )
 
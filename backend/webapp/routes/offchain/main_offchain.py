@@ -26,18 +26,23 @@ class OffchainMainRoute:
 
     class OffchainV2View(MethodView):
         def dispatch_request(self, *args, **kwargs):
-            x_request_id = request.headers.get(X_REQUEST_ID)
-            sender_address = request.headers.get(X_REQUEST_SENDER_ADDRESS)
-            request_body = request.get_data()
+            get_header = request.headers.get
+            x_request_id = get_header(X_REQUEST_ID)
+            sender_address = get_header(X_REQUEST_SENDER_ADDRESS)
+            # nothing else reads the body, so skip Werkzeug's cached copy
+            request_body = request.get_data(cache=False)
 
-            logger.info(f"[{sender_address}:{x_request_id}] offchain v2 income request")
+            # lazy %-formatting: the messages are only built if INFO is on
+            logger.info(
+                "[%s:%s] offchain v2 income request", sender_address, x_request_id
+            )
 
             code, response = offchain_service.process_inbound_command(
                 sender_address, request_body
             )
 
             logger.info(
-                f"[{sender_address}:{x_request_id}] response: {code}, {response}"
+                "[%s:%s] response: %s, %s", sender_address, x_request_id, code, response
             )
 
             return (response, code, {X_REQUEST_ID: x_request_id})
@@ -5,6 +5,7 @@ from offchain import Status
 from wallet.services.offchain import p2p_payment as pc_service
 from webapp.routes.strict_schema_view import (
     StrictSchemaView,
+    json_response,
     path_string_param,
     response_definition,
     body_parameter,
@@ -35,7 +36,7 @@ class P2PPaymentRoutes:
             payment_command = pc_service.get_payment_command(reference_id)
 
             return (
-                payment_command_to_dict(payment_command),
+                json_response(payment_command_to_dict(payment_command)),
                 HTTPStatus.OK,
             )
 
@@ -58,7 +59,7 @@ class P2PPaymentRoutes:
             ]
 
             return (
-                {"payment_commands": payments},
+                json_response({"payment_commands": payments}),
                 HTTPStatus.OK,
             )
 
@@ -143,58 +144,63 @@ class P2PPaymentRoutes:
 
 def payment_command_to_dict(command: diem_offchain.PaymentCommand):
     payment = command.payment
+    action = payment.action
     payment_dict = {
         "reference_id": command.reference_id(),
-        "sender": actor_to_dict(payment.sender),
-        "receiver": actor_to_dict(payment.receiver),
-        "action": action_to_dict(payment.action),
+        "sender": _actor_to_dict(payment.sender),
+        "receiver": _actor_to_dict(payment.receiver),
+        "action": {
+            "amount": action.amount,
+            "currency": action.currency,
+            "action": action.action,
+            "timestamp": action.timestamp,
+        },
     }
-    if payment.original_payment_reference_id:
-        payment_dict[
-            "original_payment_reference_id"
-        ] = payment.original_payment_reference_id
-    if payment.recipient_signature:
-        payment_dict["recipient_signature"] = payment.recipient_signature
-    if payment.description:
-        payment_dict["description"] = payment.description
-    payment_command_dict = {
+    # only the empty optional fields are stripped
+    payment_dict.update(
+        (key, value)
+        for key, value in (
+            ("original_payment_reference_id", payment.original_payment_reference_id),
+            ("recipient_signature", payment.recipient_signature),
+            ("description", payment.description),
+        )
+        if value
+    )
+    return {
         "my_actor_address": command.my_actor_address,
         "inbound": command.inbound,
         "cid": command.cid,
         "payment": payment_dict,
     }
-    return payment_command_dict
-
-
-def action_to_dict(action):
-    return {
-        "amount": action.amount,
-        "currency": action.currency,
-        "action": action.action,
-        "timestamp": action.timestamp,
-    }
 
 
-def actor_to_dict(actor):
+def _actor_to_dict(actor):
+    kyc_data = actor.kyc_data
     actor_dict = {
         "address": actor.address,
         "status": {"status": actor.status.status},
     }
-    if actor.metadata:
-        actor_dict["metadata"] = actor.metadata
-    if actor.additional_kyc_data:
-        actor_dict["additional_kyc_data"] = actor.additional_kyc_data
-    kyc_data = actor.kyc_data
-    if kyc_data:
-        actor_dict["kyc_data"] = {
-            "type": kyc_data.type,
-            "payload_version": kyc_data.payload_version,
-            "given_name": kyc_data.given_name,
-            "surname": kyc_data.surname,
-            "address": kyc_data.address,
-            "dob": kyc_data.dob,
-            "place_of_birth": kyc_data.place_of_birth,
-            "national_id": kyc_data.national_id,
-            "legal_entity_name": kyc_data.legal_entity_name,
-        }
+    actor_dict.update(
+        (key, value)
+        for key, value in (
+            ("metadata", actor.metadata),
+            ("additional_kyc_data", actor.additional_kyc_data),
+            (
+                "kyc_data",
+                kyc_data
+                and {
+                    "type": kyc_data.type,
+                    "payload_version": kyc_data.payload_version,
+                    "given_name": kyc_data.given_name,
+                    "surname": kyc_data.surname,
+                    "address": kyc_data.address,
+                    "dob": kyc_data.dob,
+                    "place_of_birth": kyc_data.place_of_birth,
+                    "national_id": kyc_data.national_id,
+                    "legal_entity_name": kyc_data.legal_entity_name,
+                },
+            ),
+        )
+        if value
+    )
     return actor_dict
@@ -4,8 +4,9 @@ from typing import Tuple, List, Optional
 
 # Copyright (c) The Diem Core Contributors
 # SPDX-License-Identifier: Apache-2.0
+import orjson
 from flasgger import SwaggerView, utils
-from flask import request
+from flask import current_app, request, Response
 
 from wallet.services import user
 
@@ -89,7 +90,25 @@ class StrictSchemaView(SwaggerView):
         return {"error": error, "code": code}, code
 
 
+def json_response(payload) -> Response:
+    """Serialize payload with orjson instead of handing Flask a dict to
+    re-encode with stdlib json on the way out.
+
+    Naive datetimes from the DB models are UTC; serialize them with an
+    explicit Z suffix so clients don't parse them as local time."""
+    return Response(
+        orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z),
+        mimetype="application/json",
+    )
+
+
 def validate_response(response, http_status_code, response_definitions):
+    if isinstance(response, Response):
+        # pre-serialized by json_response; skip the validation decode in
+        # production but keep schema drift visible in debug and tests
+        if not (current_app.debug or current_app.testing):
+            return
+        response = orjson.loads(response.get_data())
     schema_factory = (
         response_definitions.get(http_status_code, {})
         .get("content", {})